@@ -12,7 +12,9 @@ class Settings(BaseSettings):
     engraver: str = Field(default_factory=lambda: os.getenv("ENGRAVER", "lilypond"))
     engraver_path: str | None = Field(default_factory=lambda: os.getenv("ENGRAVER_PATH"))
     musicxml2ly_path: str | None = Field(default_factory=lambda: os.getenv("MUSICXML2LY_PATH"))
+    redis_url: str | None = Field(default_factory=lambda: os.getenv("REDIS_URL"))
     basic_pitch_model_path: str | None = Field(default_factory=lambda: os.getenv("BASIC_PITCH_MODEL"))
+    basic_pitch_workers: int = Field(default=1)
     max_file_mb: int = Field(default=20)
     max_duration_seconds: int = Field(default=5 * 60)
     allowed_mime_types: tuple[str, ...] = ("audio/wav", "audio/x-wav", "audio/mpeg", "audio/mp3", "audio/x-m4a", "audio/flac", "audio/x-flac")
@@ -2,19 +2,21 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+from concurrent.futures import ThreadPoolExecutor
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from .config import settings
 from .models import Job
 from .routes import jobs
 from .services.job_manager import JobManager
-from .services.pipeline import PipelineDependencies, run_pipeline
+from .services.pipeline import PipelineDependencies, run_pipeline, warm_up
 
 
-app = FastAPI(title="ScoreForge API", version="1.0.0")
+app = FastAPI(title="ScoreForge API", version="1.0.0", default_response_class=ORJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -35,23 +37,32 @@ async def process_job(job: Job) -> None:
 
 @app.on_event("startup")
 async def startup_event() -> None:
+    # aiofiles and asyncio.to_thread share the default executor; size it so a
+    # handful of concurrent uploads do not queue behind job persistence.
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=32, thread_name_prefix="io"))
+    app.state.duration_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="duration")
+    await warm_up()
     manager = JobManager(processor=process_job)
     app.state.job_manager = manager
-    await manager.load_existing_jobs()
     await manager.start()
-    app.state.cleanup_task = asyncio.create_task(_cleanup_loop(manager))
+    # Retained jobs are reloaded in the background so readiness does not
+    # depend on how many are on disk; lookups fall through to the store meanwhile.
+    app.state.reload_task = asyncio.create_task(manager.load_existing_jobs())
 
 
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
+    reload_task: asyncio.Task[None] | None = getattr(app.state, "reload_task", None)
+    if reload_task and not reload_task.done():
+        reload_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await reload_task
     manager: JobManager | None = getattr(app.state, "job_manager", None)
     if manager:
         await manager.shutdown()
-    cleanup_task = getattr(app.state, "cleanup_task", None)
-    if cleanup_task:
-        cleanup_task.cancel()
-        with contextlib.suppress(asyncio.CancelledError):
-            await cleanup_task
+    duration_executor: ThreadPoolExecutor | None = getattr(app.state, "duration_executor", None)
+    if duration_executor:
+        duration_executor.shutdown(wait=False)
 
 
 @app.get("/healthz")
@@ -60,9 +71,3 @@ async def health_check() -> dict[str, str]:
 
 
 app.include_router(jobs.router, prefix="/api")
-
-
-async def _cleanup_loop(manager: JobManager) -> None:
-    while True:
-        await asyncio.sleep(60)
-        await manager.cleanup_expired()
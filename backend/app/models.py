@@ -7,7 +7,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class JobStatus(str, enum.Enum):
@@ -23,12 +23,14 @@ class QuantizationGrid(str, enum.Enum):
     sixteenth = "sixteenth"
 
     def to_fraction(self) -> float:
-        mapping = {
-            QuantizationGrid.quarter: 1 / 4,
-            QuantizationGrid.eighth: 1 / 8,
-            QuantizationGrid.sixteenth: 1 / 16,
-        }
-        return mapping[self]
+        return _GRID_FRACTIONS[self]
+
+
+_GRID_FRACTIONS = {
+    QuantizationGrid.quarter: 1 / 4,
+    QuantizationGrid.eighth: 1 / 8,
+    QuantizationGrid.sixteenth: 1 / 16,
+}
 
 
 class ClefChoice(str, enum.Enum):
@@ -46,6 +48,8 @@ class InstrumentChoice(str, enum.Enum):
 
 
 class JobOptions(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     clef: ClefChoice = ClefChoice.treble
     instrument: InstrumentChoice = InstrumentChoice.piano
     tempo: Optional[int] = None
@@ -66,6 +70,8 @@ class JobArtifactUrls(BaseModel):
 
 
 class JobMeta(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     title: Optional[str] = None
     key: Optional[str] = None
     time_signature: Optional[str] = None
@@ -109,12 +115,14 @@ class Job:
         )
 
     def to_response(self, base_url: str | None = None) -> JobStatusResponse:
-        urls = JobArtifactUrls(
+        # Built from trusted internal state; the route's response_model still
+        # governs what goes over the wire.
+        urls = JobArtifactUrls.model_construct(
             pdf=self._format_url("pdf", base_url),
             musicxml=self._format_url("musicxml", base_url),
             midi=self._format_url("midi", base_url),
         )
-        return JobStatusResponse(
+        return JobStatusResponse.model_construct(
             status=self.status,
             progress=self.progress,
             error=self.error,
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures import Executor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Annotated
 
-from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
+import aiofiles
+import soundfile as sf
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, Response, UploadFile
+from fastapi.routing import APIRoute
 
 from ..config import settings
 from ..models import (
@@ -17,7 +22,47 @@ from ..models import (
 )
 from ..services.job_manager import JobManager
 
-router = APIRouter(prefix="/jobs", tags=["jobs"])
+try:  # pragma: no cover - optional dependency
+    import mutagen  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    mutagen = None
+
+try:  # pragma: no cover - optional dependency
+    import av  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    av = None
+
+UPLOAD_CHUNK_SIZE = 1 << 20
+# Allowance for multipart boundaries and the option fields sent alongside the file.
+MULTIPART_OVERHEAD_BYTES = 4096
+
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
+class _UploadLimitRoute(APIRoute):
+    """Reject uploads whose declared size is over the limit before the body is read."""
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def _handler(request: Request) -> Response:
+            if request.method == "POST":
+                _check_content_length(request)
+            return await handler(request)
+
+        return _handler
+
+
+router = APIRouter(prefix="/jobs", tags=["jobs"], route_class=_UploadLimitRoute)
+
+
+def _check_content_length(request: Request) -> None:
+    content_length = request.headers.get("content-length")
+    if not content_length or not content_length.isdigit():
+        return
+    max_bytes = settings.max_file_mb * 1024 * 1024
+    if int(content_length) > max_bytes + MULTIPART_OVERHEAD_BYTES:
+        raise HTTPException(status_code=413, detail="File exceeds maximum allowed size of 20MB")
 
 
 async def get_manager(request: Request) -> JobManager:
@@ -32,20 +77,63 @@ def _sanitize_bool(value: str | bool | None, *, default: bool) -> bool:
         return value
     if value is None or value == "":
         return default
-    return value.lower() in {"1", "true", "yes", "on"}
+    return value.lower() in _TRUE_VALUES
+
+
+@dataclass(frozen=True, slots=True)
+class JobOptionsForm:
+    """Raw multipart fields for :class:`JobOptions`, as sent by the uploader.
+
+    Defaults live only on :meth:`as_form`; values are validated once, by
+    :class:`JobOptions` in :meth:`to_options`.
+    """
+
+    clef: str
+    instrument: str
+    tempo: str | None
+    force_key: str | None
+    detect_time_signature: str | None
+    quantization: str
+    loose_quantization: str | None
+
+    @classmethod
+    def as_form(
+        cls,
+        clef: str = Form(ClefChoice.treble.value),
+        instrument: str = Form(InstrumentChoice.piano.value),
+        tempo: str | None = Form(default=None),
+        force_key: str | None = Form(default=None),
+        detect_time_signature: str | None = Form(default="true"),
+        quantization: str = Form(QuantizationGrid.eighth.value),
+        loose_quantization: str | None = Form(default="false"),
+    ) -> "JobOptionsForm":
+        return cls(
+            clef=clef,
+            instrument=instrument,
+            tempo=tempo,
+            force_key=force_key,
+            detect_time_signature=detect_time_signature,
+            quantization=quantization,
+            loose_quantization=loose_quantization,
+        )
+
+    def to_options(self) -> JobOptions:
+        return JobOptions(
+            clef=self.clef,
+            instrument=self.instrument,
+            tempo=self.tempo or None,
+            force_key=self.force_key or None,
+            detect_time_signature=_sanitize_bool(self.detect_time_signature, default=True),
+            quantization=self.quantization,
+            loose_quantization=_sanitize_bool(self.loose_quantization, default=False),
+        )
 
 
 @router.post("", response_model=JobCreateResponse)
 async def create_job(
     request: Request,
     file: UploadFile = File(...),
-    clef: str = Form(ClefChoice.treble.value),
-    instrument: str = Form(InstrumentChoice.piano.value),
-    tempo: str | None = Form(default=None),
-    force_key: str | None = Form(default=None),
-    detect_time_signature: str | None = Form(default="true"),
-    quantization: str = Form(QuantizationGrid.eighth.value),
-    loose_quantization: str | None = Form(default="false"),
+    form: JobOptionsForm = Depends(JobOptionsForm.as_form),
 ) -> JobCreateResponse:
     manager = await get_manager(request)
 
@@ -56,15 +144,7 @@ async def create_job(
     suffix = Path(file.filename or "audio").suffix or ".wav"
 
     try:
-        options = JobOptions(
-            clef=ClefChoice(clef),
-            instrument=InstrumentChoice(instrument),
-            tempo=int(tempo) if tempo else None,
-            force_key=force_key or None,
-            detect_time_signature=_sanitize_bool(detect_time_signature, default=True),
-            quantization=QuantizationGrid(quantization),
-            loose_quantization=_sanitize_bool(loose_quantization, default=False),
-        )
+        options = form.to_options()
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -73,15 +153,15 @@ async def create_job(
     upload_path = job.workdir / f"upload{suffix}"
     written = 0
     try:
-        with upload_path.open("wb") as destination:
+        async with aiofiles.open(upload_path, "wb") as destination:
             while True:
-                chunk = await file.read(1024 * 512)
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
                 if not chunk:
                     break
                 written += len(chunk)
                 if written > max_bytes:
                     raise HTTPException(status_code=400, detail="File exceeds maximum allowed size of 20MB")
-                destination.write(chunk)
+                await destination.write(chunk)
     except HTTPException:
         upload_path.unlink(missing_ok=True)
         await manager.discard(job.id)
@@ -95,7 +175,7 @@ async def create_job(
         raise HTTPException(status_code=400, detail="Uploaded file is empty")
 
     try:
-        await _validate_duration(upload_path)
+        await _validate_duration(upload_path, getattr(request.app.state, "duration_executor", None))
     except HTTPException:
         upload_path.unlink(missing_ok=True)
         await manager.discard(job.id)
@@ -105,24 +185,47 @@ async def create_job(
     return JobCreateResponse(job_id=job.id)
 
 
-async def _validate_duration(path: Path) -> None:
-    loop = asyncio.get_event_loop()
-    duration = await loop.run_in_executor(None, _get_duration, path)
+async def _validate_duration(path: Path, executor: Executor | None = None) -> None:
+    loop = asyncio.get_running_loop()
+    duration = await loop.run_in_executor(executor, _get_duration, path)
     if duration > settings.max_duration_seconds:
         path.unlink(missing_ok=True)
         raise HTTPException(status_code=400, detail="Audio duration exceeds limit of five minutes")
 
 
 def _get_duration(path: Path) -> float:
-    import librosa
-
-    return float(librosa.get_duration(filename=str(path)))
+    # Container headers give the duration without decoding any samples;
+    # PyAV is only used when neither soundfile nor mutagen can read them.
+    try:
+        info = sf.info(str(path))
+    except Exception:
+        pass
+    else:
+        if info.samplerate > 0 and info.frames > 0:
+            return info.frames / info.samplerate
+
+    if mutagen is not None:
+        try:
+            tagged = mutagen.File(path)
+        except Exception:
+            tagged = None
+        length = getattr(getattr(tagged, "info", None), "length", None)
+        if length:
+            return float(length)
+
+    if av is not None:
+        try:
+            with av.open(str(path)) as container:
+                if container.duration:
+                    return container.duration / av.time_base
+        except Exception:
+            pass
+    raise HTTPException(status_code=400, detail="Unable to determine audio duration")
 
 
 @router.get("/{job_id}", response_model=JobStatusResponse)
 async def get_job_status(job_id: str, request: Request) -> JobStatusResponse:
     manager = await get_manager(request)
-    await manager.cleanup_expired()
     job = await manager.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import logging
+import os
+from collections import defaultdict
 from contextlib import suppress
 from datetime import datetime, timedelta, timezone
 from typing import Awaitable, Callable
@@ -9,11 +13,16 @@ import shutil
 
 from ..config import settings
 from ..models import Job, JobOptions, JobStatus
-from .job_store import JobStore
+from .job_store import JobStoreBackend, create_job_store
 
 
 Processor = Callable[[Job], Awaitable[None]]
 
+logger = logging.getLogger(__name__)
+
+_TERMINAL_STATUSES = frozenset({JobStatus.done, JobStatus.error})
+_REMOVAL_CONCURRENCY = 4
+
 
 class JobManager:
     def __init__(
@@ -22,39 +31,56 @@ class JobManager:
         processor: Processor,
         retention: timedelta | None = None,
         base_url: str | None = None,
-        store: JobStore | None = None,
+        store: JobStoreBackend | None = None,
+        max_concurrency: int | None = None,
     ) -> None:
         self._queue: asyncio.Queue[Job] = asyncio.Queue()
-        self._tasks: set[asyncio.Task[None]] = set()
         self._processor = processor
         self._retention = retention or timedelta(minutes=settings.job_retention_minutes)
         self._base_url = base_url
-        self._worker_task: asyncio.Task[None] | None = None
-        self._lock = asyncio.Lock()
-        self._store = store or JobStore(settings.storage_dir)
+        self._max_concurrency = max(1, max_concurrency or os.cpu_count() or 1)
+        self._worker_tasks: list[asyncio.Task[None]] = []
+        self._expiry_task: asyncio.Task[None] | None = None
+        self._expiry_heap: list[tuple[datetime, str]] = []
+        self._expiry_event = asyncio.Event()
+        # Per-job locks keep a save and a delete of the same job from
+        # interleaving without serialising unrelated jobs.
+        self._locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._store = store or create_job_store()
+        # Jobs this manager owns, plus finished jobs read from the shared
+        # store. Unfinished jobs owned elsewhere are always re-read.
+        self._cache: dict[str, Job] = {}
+        # Ids known to or allocated by this manager while load_existing_jobs
+        # runs. The reload overlaps request handling, so it must not mistake
+        # these for jobs orphaned by a previous process; None outside a reload.
+        self._local_ids: set[str] | None = None
 
     async def start(self) -> None:
-        if self._worker_task is None:
-            self._worker_task = asyncio.create_task(self._worker())
+        if not self._worker_tasks:
+            self._worker_tasks = [asyncio.create_task(self._worker()) for _ in range(self._max_concurrency)]
+        if self._expiry_task is None:
+            self._expiry_task = asyncio.create_task(self._expiry_loop())
 
     async def shutdown(self) -> None:
-        if self._worker_task:
-            self._worker_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await self._worker_task
-            self._worker_task = None
-        tasks = list(self._tasks)
-        for task in tasks:
+        for task in self._worker_tasks:
             task.cancel()
-        for task in tasks:
+        for task in self._worker_tasks:
             with suppress(asyncio.CancelledError):
                 await task
-        self._tasks.clear()
+        self._worker_tasks = []
+        if self._expiry_task:
+            self._expiry_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._expiry_task
+            self._expiry_task = None
 
     async def allocate(self, options: JobOptions) -> Job:
         job = Job.create(options=options, retention=self._retention, workdir=settings.storage_dir)
+        if self._local_ids is not None:
+            self._local_ids.add(job.id)
         job.workdir.mkdir(parents=True, exist_ok=True)
         await self._save(job)
+        self._schedule_expiry(job)
         return job
 
     async def enqueue(self, job: Job) -> None:
@@ -69,26 +95,62 @@ class JobManager:
     async def get(self, job_id: str) -> Job | None:
         job = await self._load(job_id)
         if job and job.expires_at <= self._now():
-            await self._remove(job_id)
+            await self._remove_job(job)
             return None
         return job
 
     async def cleanup_expired(self) -> None:
         loop_time = self._now()
-        jobs = await self._list_jobs()
-        for job in jobs:
-            if job.expires_at <= loop_time:
-                await self._remove(job.id)
+        due: list[str] = []
+        while self._expiry_heap and self._expiry_heap[0][0] <= loop_time:
+            due.append(heapq.heappop(self._expiry_heap)[1])
+        if not due:
+            return
+        loaded = await asyncio.gather(*(self._load(job_id) for job_id in due))
+        await self._remove_jobs([job for job in loaded if job is not None])
+
+    def _schedule_expiry(self, job: Job) -> None:
+        heapq.heappush(self._expiry_heap, (job.expires_at, job.id))
+        self._expiry_event.set()
+
+    async def _expiry_loop(self) -> None:
+        # Sleep until the earliest expiry; new schedules wake us early in case
+        # they expire sooner than the current head of the heap.
+        while True:
+            if not self._expiry_heap:
+                await self._expiry_event.wait()
+                self._expiry_event.clear()
+                continue
+            expires_at, _ = self._expiry_heap[0]
+            delay = (expires_at - self._now()).total_seconds()
+            if delay > 0:
+                self._expiry_event.clear()
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._expiry_event.wait(), timeout=delay)
+                continue
+            await self.cleanup_expired()
 
     async def _worker(self) -> None:
+        # Each worker runs one job at a time, so the number of workers caps
+        # how many pipelines execute concurrently.
         while True:
             job = await self._queue.get()
-            job.status = JobStatus.running
-            job.progress = 5
-            await self._save(job)
-            task = asyncio.create_task(self._run_job(job))
-            self._tasks.add(task)
-            task.add_done_callback(self._tasks.discard)
+            try:
+                await self._handle(job)
+            except Exception:
+                # A failed save or delete must not take the worker down with it.
+                logger.exception("Failed to process job %s", job.id)
+            finally:
+                self._queue.task_done()
+
+    async def _handle(self, job: Job) -> None:
+        if job.expires_at <= self._now():
+            await self._remove_job(job)
+            return
+        job.status = JobStatus.running
+        job.progress = 5
+        await self._save(job)
+        await self._run_job(job)
 
     async def _run_job(self, job: Job) -> None:
         try:
@@ -100,14 +162,35 @@ class JobManager:
             job.error = str(exc)
             job.progress = 100
         finally:
-            await self._save(job)
-            self._queue.task_done()
+            # Expiry pops the job's only heap entry, so a job that expired
+            # mid-run is removed here rather than saved back with no timer.
+            if job.expires_at <= self._now():
+                await self._remove_job(job)
+            else:
+                await self._save(job)
 
     async def _remove(self, job_id: str) -> None:
         job = await self._load(job_id)
-        await self._delete(job_id)
-        if job and job.workdir and job.workdir.exists():
-            shutil.rmtree(job.workdir, ignore_errors=True)
+        if job is None:
+            await self._delete(job_id)
+            return
+        await self._remove_job(job)
+
+    async def _remove_job(self, job: Job) -> None:
+        await self._delete(job.id)
+        if job.workdir:
+            await asyncio.to_thread(shutil.rmtree, job.workdir, ignore_errors=True)
+
+    async def _remove_jobs(self, jobs: list[Job]) -> None:
+        # Bounded so a cleanup burst does not occupy the whole default
+        # thread pool with rmtree calls.
+        limit = asyncio.Semaphore(_REMOVAL_CONCURRENCY)
+
+        async def _remove_one(job: Job) -> None:
+            async with limit:
+                await self._remove_job(job)
+
+        await asyncio.gather(*(_remove_one(job) for job in jobs))
 
     @staticmethod
     def _now():
@@ -117,27 +200,48 @@ class JobManager:
         await self._remove(job_id)
 
     async def load_existing_jobs(self) -> None:
-        jobs = await self._list_jobs()
+        self._local_ids = set(self._cache)
+        try:
+            await self._load_existing_jobs()
+        finally:
+            self._local_ids = None
+
+    async def _load_existing_jobs(self) -> None:
+        listed = await self._list_jobs()
+        local_ids = self._local_ids or set()
+        jobs = [job for job in listed if job.id not in local_ids]
         now = self._now()
+        await self._remove_jobs([job for job in jobs if job.expires_at <= now])
         for job in jobs:
             if job.expires_at <= now:
-                await self._remove(job.id)
                 continue
+            self._schedule_expiry(job)
             if job.status in {JobStatus.queued, JobStatus.running}:
                 job.status = JobStatus.queued
                 await self._save(job)
                 await self.enqueue(job)
+            else:
+                self._cache[job.id] = job
 
     async def _save(self, job: Job) -> None:
-        async with self._lock:
+        self._cache[job.id] = job
+        async with self._locks[job.id]:
             await asyncio.to_thread(self._store.save, job)
 
     async def _load(self, job_id: str) -> Job | None:
-        return await asyncio.to_thread(self._store.get, job_id)
+        job = self._cache.get(job_id)
+        if job is not None:
+            return job
+        job = await asyncio.to_thread(self._store.get, job_id)
+        if job and job.status in _TERMINAL_STATUSES:
+            self._cache[job.id] = job
+        return job
 
     async def _delete(self, job_id: str) -> None:
-        async with self._lock:
+        self._cache.pop(job_id, None)
+        async with self._locks[job_id]:
             await asyncio.to_thread(self._store.delete, job_id)
+        self._locks.pop(job_id, None)
 
     async def _list_jobs(self) -> list[Job]:
         jobs = await asyncio.to_thread(lambda: list(self._store.list_jobs()))
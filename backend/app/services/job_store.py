@@ -1,94 +1,294 @@
 from __future__ import annotations
 
-import json
-from datetime import datetime
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Optional, Union
 
-from ..models import Job, JobMeta, JobOptions, JobStatus
+import msgspec
+
+from ..config import settings
+from ..models import ClefChoice, InstrumentChoice, Job, JobMeta, JobOptions, JobStatus, QuantizationGrid
+
+try:  # pragma: no cover - optional dependency
+    import redis  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    redis = None
+
+
+_LIST_READ_WORKERS = 8
 
 
 class JobStore:
-    """Persist and retrieve :class:`Job` instances from shared storage."""
+    """Persist and retrieve :class:`Job` instances from shared storage.
+
+    Decoded jobs are remembered alongside the ``stat`` signature of the file
+    they came from, so repeated reads only re-parse files that another
+    writer has replaced since.
+    """
 
     def __init__(self, base_dir: Path) -> None:
         self._base_dir = Path(base_dir)
         self._jobs_dir = self._base_dir / "jobs"
         self._jobs_dir.mkdir(parents=True, exist_ok=True)
+        self._snapshot: Dict[str, tuple[tuple[int, int, int], Job]] = {}
 
     def save(self, job: Job) -> None:
+        raw = _encode(job)
         path = self._path_for(job.id)
-        data = self._serialise(job)
         tmp_path = path.with_suffix(path.suffix + ".tmp")
-        tmp_path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
-        tmp_path.replace(path)
+        with tmp_path.open("wb") as destination:
+            destination.write(raw)
+        # Rename keeps the inode, size and mtime, so the temp file's stat is
+        # the signature the final path will have.
+        signature = _signature(os.stat(tmp_path))
+        os.replace(tmp_path, path)
+        self._snapshot[path.name] = (signature, job)
 
     def get(self, job_id: str) -> Job | None:
-        path = self._path_for(job_id)
-        if not path.exists():
-            return None
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return self._deserialise(data)
+        return self._read(self._path_for(job_id))
 
     def delete(self, job_id: str) -> None:
         path = self._path_for(job_id)
         path.unlink(missing_ok=True)
+        self._snapshot.pop(path.name, None)
 
     def list_jobs(self) -> Iterable[Job]:
-        for file in sorted(self._jobs_dir.glob("*.json")):
+        # Order is not significant to callers, so entries are taken straight
+        # from scandir and only files whose signature changed are re-read.
+        jobs: list[Job] = []
+        pending: list[tuple[str, str, tuple[int, int, int]]] = []
+        seen: set[str] = set()
+        with os.scandir(self._jobs_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    signature = _signature(entry.stat())
+                except FileNotFoundError:
+                    continue
+                seen.add(entry.name)
+                cached = self._snapshot.get(entry.name)
+                if cached and cached[0] == signature:
+                    jobs.append(cached[1])
+                else:
+                    pending.append((entry.name, entry.path, signature))
+
+        if len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=min(_LIST_READ_WORKERS, len(pending))) as pool:
+                decoded = list(pool.map(_read_job_file, [path for _, path, _ in pending]))
+        else:
+            decoded = [_read_job_file(path) for _, path, _ in pending]
+        for (name, _, signature), job in zip(pending, decoded):
+            if job is None:
+                continue
+            self._snapshot[name] = (signature, job)
+            jobs.append(job)
+
+        for name in self._snapshot.keys() - seen:
+            self._snapshot.pop(name, None)
+        return jobs
+
+    def _read(self, path: Path) -> Job | None:
+        try:
+            signature = _signature(path.stat())
+        except FileNotFoundError:
+            self._snapshot.pop(path.name, None)
+            return None
+        cached = self._snapshot.get(path.name)
+        if cached and cached[0] == signature:
+            return cached[1]
+        job = _decode_job(path.read_bytes())
+        self._snapshot[path.name] = (signature, job)
+        return job
+
+    def _path_for(self, job_id: str) -> Path:
+        return self._jobs_dir / f"{job_id}.json"
+
+
+class RedisJobStore:
+    """Persist :class:`Job` instances in Redis hashes.
+
+    Each job lives in ``{prefix}:{id}`` with an expiry matching the job's
+    ``expires_at`` so Redis evicts finished jobs on its own. A set at
+    ``{prefix}:index`` tracks known ids for :meth:`list_jobs`.
+    """
+
+    def __init__(self, client, *, prefix: str = "jobs") -> None:
+        self._client = client
+        self._prefix = prefix
+        self._index_key = f"{prefix}:index"
+
+    @classmethod
+    def from_url(cls, url: str, *, prefix: str = "jobs") -> "RedisJobStore":
+        if redis is None:
+            raise RuntimeError("Install redis to use REDIS_URL for job storage")
+        return cls(redis.Redis.from_url(url), prefix=prefix)
+
+    def save(self, job: Job) -> None:
+        key = self._key_for(job.id)
+        pipe = self._client.pipeline()
+        pipe.hset(key, "value", _encode(job))
+        pipe.expireat(key, job.expires_at)
+        pipe.sadd(self._index_key, job.id)
+        pipe.execute()
+
+    def get(self, job_id: str) -> Job | None:
+        raw = self._client.hget(self._key_for(job_id), "value")
+        if raw is None:
+            return None
+        return _decode_job(raw)
+
+    def delete(self, job_id: str) -> None:
+        pipe = self._client.pipeline()
+        pipe.delete(self._key_for(job_id))
+        pipe.srem(self._index_key, job_id)
+        pipe.execute()
+
+    def list_jobs(self) -> Iterable[Job]:
+        job_ids = [_decode(member) for member in self._client.smembers(self._index_key)]
+        if not job_ids:
+            return
+        pipe = self._client.pipeline()
+        for job_id in job_ids:
+            pipe.hget(self._key_for(job_id), "value")
+        stale: list[str] = []
+        for job_id, raw in zip(job_ids, pipe.execute()):
+            if raw is None:
+                # The hash expired; drop the dangling index entry.
+                stale.append(job_id)
+                continue
             try:
-                data = json.loads(file.read_text(encoding="utf-8"))
-                job = self._deserialise(data)
-            except (OSError, json.JSONDecodeError, ValueError):  # pragma: no cover - corrupt job data
+                job = _decode_job(raw)
+            except (msgspec.DecodeError, ValueError):  # pragma: no cover - corrupt job data
                 continue
             else:
                 yield job
+        if stale:
+            self._client.srem(self._index_key, *stale)
 
-    def _path_for(self, job_id: str) -> Path:
-        return self._jobs_dir / f"{job_id}.json"
+    def _key_for(self, job_id: str) -> str:
+        return f"{self._prefix}:{job_id}"
+
+
+JobStoreBackend = Union[JobStore, RedisJobStore]
+
+
+def create_job_store() -> JobStoreBackend:
+    if settings.redis_url:
+        return RedisJobStore.from_url(settings.redis_url)
+    return JobStore(settings.storage_dir)
+
+
+def _read_job_file(path: str) -> Job | None:
+    try:
+        with open(path, "rb") as source:
+            return _decode_job(source.read())
+    except (OSError, msgspec.DecodeError, ValueError):  # pragma: no cover - corrupt job data
+        return None
+
+
+def _signature(stat: os.stat_result) -> tuple[int, int, int]:
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def _decode(value: bytes | str) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+class _OptionsRecord(msgspec.Struct, frozen=True, gc=False):
+    clef: ClefChoice = ClefChoice.treble
+    instrument: InstrumentChoice = InstrumentChoice.piano
+    tempo: Optional[int] = None
+    force_key: Optional[str] = None
+    detect_time_signature: bool = True
+    quantization: QuantizationGrid = QuantizationGrid.eighth
+    loose_quantization: bool = False
+
+
+class _MetaRecord(msgspec.Struct, frozen=True, gc=False):
+    title: Optional[str] = None
+    key: Optional[str] = None
+    time_signature: Optional[str] = None
+    tempo: Optional[int] = None
+    note_count: Optional[int] = None
+    duration_seconds: Optional[float] = None
+    instrument: Optional[InstrumentChoice] = None
+
+
+class _JobRecord(msgspec.Struct, gc=False):
+    """On-disk representation of a :class:`Job`."""
+
+    id: str
+    # Unix milliseconds; ISO strings are still accepted from older records.
+    created_at: Union[int, datetime]
+    expires_at: Union[int, datetime]
+    options: _OptionsRecord = msgspec.field(default_factory=_OptionsRecord)
+    status: JobStatus = JobStatus.queued
+    progress: int = 0
+    error: Optional[str] = None
+    meta: Optional[_MetaRecord] = None
+    artifacts: Dict[str, str] = msgspec.field(default_factory=dict)
+    workdir: Optional[str] = None
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_encoder = msgspec.json.Encoder()
+_decoder = msgspec.json.Decoder(_JobRecord)
+
+
+def _encode(job: Job) -> bytes:
+    return _encoder.encode(_to_record(job))
+
+
+def _decode_job(raw: bytes) -> Job:
+    return _from_record(_decoder.decode(raw))
+
+
+def _to_record(job: Job) -> _JobRecord:
+    options = _OptionsRecord(**{name: getattr(job.options, name) for name in _OptionsRecord.__struct_fields__})
+    meta = None
+    if job.meta:
+        meta = _MetaRecord(**{name: getattr(job.meta, name) for name in _MetaRecord.__struct_fields__})
+    return _JobRecord(
+        id=job.id,
+        created_at=_to_millis(job.created_at),
+        expires_at=_to_millis(job.expires_at),
+        options=options,
+        status=job.status,
+        progress=job.progress,
+        error=job.error,
+        meta=meta,
+        artifacts={key: str(path) for key, path in job.artifacts.items()},
+        workdir=str(job.workdir) if job.workdir else None,
+    )
+
+
+def _from_record(record: _JobRecord) -> Job:
+    # The decoder has already type-checked every field (enums included), so
+    # the pydantic models are built without running their validators again.
+    meta = JobMeta.model_construct(**msgspec.structs.asdict(record.meta)) if record.meta else None
+    return Job(
+        id=record.id,
+        created_at=_from_millis(record.created_at),
+        expires_at=_from_millis(record.expires_at),
+        options=JobOptions.model_construct(**msgspec.structs.asdict(record.options)),
+        status=record.status,
+        progress=record.progress,
+        error=record.error,
+        meta=meta,
+        artifacts={key: Path(value) for key, value in record.artifacts.items()},
+        workdir=Path(record.workdir) if record.workdir else None,
+    )
+
+
+def _to_millis(value: datetime) -> int:
+    return (value - _EPOCH) // timedelta(milliseconds=1)
 
-    def _serialise(self, job: Job) -> Dict[str, object]:
-        return {
-            "id": job.id,
-            "created_at": job.created_at.isoformat(),
-            "expires_at": job.expires_at.isoformat(),
-            "options": job.options.model_dump(),
-            "status": job.status.value,
-            "progress": job.progress,
-            "error": job.error,
-            "meta": job.meta.model_dump() if job.meta else None,
-            "artifacts": {key: str(path) for key, path in job.artifacts.items()},
-            "workdir": str(job.workdir) if job.workdir else None,
-        }
-
-    def _deserialise(self, data: Dict[str, object]) -> Job:
-        created_at = datetime.fromisoformat(str(data["created_at"]))
-        expires_at = datetime.fromisoformat(str(data["expires_at"]))
-        options_data = data.get("options") or {}
-        if not isinstance(options_data, dict):
-            options_data = {}
-        options = JobOptions(**options_data)
-        status = JobStatus(str(data.get("status", JobStatus.queued.value)))
-        progress = int(data.get("progress", 0))
-        error = data.get("error")
-        meta_data = data.get("meta")
-        meta = JobMeta(**meta_data) if isinstance(meta_data, dict) else None
-        artifacts_data = data.get("artifacts") or {}
-        if not isinstance(artifacts_data, dict):
-            artifacts_data = {}
-        artifacts = {key: Path(str(value)) for key, value in artifacts_data.items()}
-        workdir_value = data.get("workdir")
-        workdir = Path(workdir_value) if workdir_value else None
-        return Job(
-            id=str(data["id"]),
-            created_at=created_at,
-            expires_at=expires_at,
-            options=options,
-            status=status,
-            progress=progress,
-            error=error,
-            meta=meta,
-            artifacts=artifacts,
-            workdir=workdir,
-        )
 
+def _from_millis(value: int | datetime) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    return _EPOCH + timedelta(milliseconds=value)
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import importlib
+import math
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 import os
+import shutil
 from pathlib import Path, PureWindowsPath
-from typing import Any, Optional
+from typing import Any, Callable, Optional, TypeVar
 
 import numpy as np
 import soundfile as sf
@@ -15,9 +20,24 @@ from ..config import settings
 from ..models import ClefChoice, InstrumentChoice, Job, JobMeta, QuantizationGrid
 
 try:  # pragma: no cover - optional dependency
-    import librosa  # type: ignore
+    import av  # type: ignore
 except Exception:  # pragma: no cover - optional dependency
-    librosa = None
+    av = None
+
+try:  # pragma: no cover - optional dependency
+    import music21  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    music21 = None
+
+try:  # pragma: no cover - optional dependency
+    import pretty_midi  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    pretty_midi = None
+
+try:  # pragma: no cover - optional dependency
+    from scipy import signal as scipy_signal  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    scipy_signal = None
 
 
 @dataclass
@@ -38,6 +58,52 @@ class PipelineError(RuntimeError):
     """Raised when the pipeline fails."""
 
 
+T = TypeVar("T")
+
+# Blocking stages run on their own bounded pools so concurrent jobs overlap
+# across stages without any of them stalling the event loop. music21 keeps
+# module-level state, so score assembly stays single-threaded.
+_STAGE_CONCURRENCY = {
+    "normalise": 2,
+    "transcribe": max(settings.basic_pitch_workers, 1),
+    "quantize": 2,
+    "score": 1,
+    "engrave": 2,
+}
+_STAGE_EXECUTORS = {
+    stage: ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"pipeline-{stage}")
+    for stage, workers in _STAGE_CONCURRENCY.items()
+}
+
+
+_COMPRESSED_SUFFIXES = frozenset({".mp3", ".m4a", ".aac"})
+_STREAM_BLOCK_FRAMES = 1 << 16
+
+# The only stage dependencies still imported inside the stages (TensorFlow
+# and ReportLab's fonts); warm_up() pays their import cost at startup.
+_WARM_MODULES = (
+    "basic_pitch.inference",
+    "reportlab.pdfgen.canvas",
+)
+
+
+async def warm_up() -> None:
+    await asyncio.to_thread(_import_warm_modules)
+
+
+def _import_warm_modules() -> None:
+    for name in _WARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:  # pragma: no cover - optional dependency
+            continue
+
+
+async def _run_stage(stage: str, func: Callable[..., T], *args: Any) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_STAGE_EXECUTORS[stage], func, *args)
+
+
 async def run_pipeline(job: Job, deps: PipelineDependencies | None = None, options: PipelineOptions | None = None) -> None:
     deps = deps or PipelineDependencies()
     options = options or PipelineOptions()
@@ -55,30 +121,17 @@ async def run_pipeline(job: Job, deps: PipelineDependencies | None = None, optio
     audio_info = await _normalise_audio(job, raw_audio_path, options)
 
     job.progress = 30
-    quantizer = deps.quantizer or MidiQuantizer()
-    transcriber = deps.transcriber or load_transcriber()
-    try:
-        await transcriber.transcribe(raw_audio_path, midi_path, job, audio_info)
-    except PipelineError:
-        if not isinstance(transcriber, StubTranscriber):
-            fallback = StubTranscriber(_default_stub_midi())
-            await fallback.transcribe(raw_audio_path, midi_path, job, audio_info)
-            transcriber = fallback
-        else:
-            raise
+    await _stage_transcribe(deps, raw_audio_path, midi_path, job, audio_info)
 
     job.progress = 60
     quantized_midi_path = workdir / "quantized.mid"
-    quantizer.quantize(midi_path, quantized_midi_path, job)
+    await _stage_quantize(deps, midi_path, quantized_midi_path, job)
 
     job.progress = 75
-    metadata_builder = deps.metadata_builder or MetadataBuilder()
-    musicxml_path = metadata_builder.build_musicxml(quantized_midi_path, musicxml_path, job)
-    job.meta = metadata_builder.meta
+    musicxml_path = await _stage_score(deps, quantized_midi_path, musicxml_path, job)
 
     job.progress = 90
-    engraver = deps.engraver or load_engraver()
-    engraver.engrave(musicxml_path, pdf_path)
+    await _stage_engrave(deps, musicxml_path, pdf_path)
 
     job.artifacts = {
         "midi": quantized_midi_path,
@@ -87,77 +140,234 @@ async def run_pipeline(job: Job, deps: PipelineDependencies | None = None, optio
     }
 
 
+async def _stage_transcribe(deps: PipelineDependencies, audio_path: Path, midi_path: Path, job: Job, audio_info: dict) -> None:
+    transcriber = deps.transcriber or load_transcriber()
+    try:
+        await transcriber.transcribe(audio_path, midi_path, job, audio_info)
+    except PipelineError:
+        if isinstance(transcriber, StubTranscriber):
+            raise
+        fallback = StubTranscriber(_default_stub_midi())
+        await fallback.transcribe(audio_path, midi_path, job, audio_info)
+
+
+async def _stage_quantize(deps: PipelineDependencies, midi_path: Path, output_path: Path, job: Job) -> None:
+    quantizer = deps.quantizer or MidiQuantizer()
+    await _run_stage("quantize", quantizer.quantize, midi_path, output_path, job)
+
+
+async def _stage_score(deps: PipelineDependencies, midi_path: Path, musicxml_path: Path, job: Job) -> Path:
+    metadata_builder = deps.metadata_builder or MetadataBuilder()
+    output_path = await _run_stage("score", metadata_builder.build_musicxml, midi_path, musicxml_path, job)
+    job.meta = metadata_builder.meta
+    return output_path
+
+
+async def _stage_engrave(deps: PipelineDependencies, musicxml_path: Path, pdf_path: Path) -> None:
+    engraver = deps.engraver or load_engraver()
+    await engraver.engrave(musicxml_path, pdf_path)
+
+
 async def _normalise_audio(job: Job, output_path: Path, options: PipelineOptions) -> dict:
+    return await _run_stage("normalise", _normalise_audio_blocking, job, output_path, options)
+
+
+def _normalise_audio_blocking(job: Job, output_path: Path, options: PipelineOptions) -> dict:
     if job.workdir is None:
         raise PipelineError("Job workdir missing")
 
-    candidates = sorted(job.workdir.glob("upload*"))
-    if not candidates:
+    source = min(job.workdir.glob("upload*"), default=None)
+    if source is None:
         raise PipelineError("Uploaded audio missing")
-    source = candidates[0]
+    if source.suffix.lower() not in _COMPRESSED_SUFFIXES:
+        try:
+            return _normalise_streamed(source, output_path, options)
+        except sf.LibsndfileError:
+            pass  # Not a format libsndfile can stream; decode it in memory below.
     audio_data, sr = _load_audio_array(source)
+    return _normalise_array(audio_data, sr, source, output_path, options)
+
+
+def _normalise_streamed(source: Path, output_path: Path, options: PipelineOptions) -> dict:
+    target_sr = options.sample_rate
+    with sf.SoundFile(source) as reader:
+        sr = reader.samplerate
+        channels = 1 if options.mono else reader.channels
+        blocks = reader.blocks(blocksize=_STREAM_BLOCK_FRAMES, dtype="float32", always_2d=True)
+        if options.mono:
+            blocks = (_downmix(block) if block.shape[1] > 1 else block[:, 0] for block in blocks)
+
+        if sr != target_sr:
+            # The polyphase filter needs the whole signal, so only the
+            # downmixed float32 copy is kept in memory before resampling.
+            chunks = list(blocks)
+            if not chunks:
+                raise PipelineError("Uploaded file appears to be empty")
+            audio_data = np.concatenate(chunks)
+            return _normalise_array(audio_data, sr, source, output_path, options)
+
+        frames = 0
+        peak = 0.0
+        # An upload already in the output format only needs the silence scan;
+        # it is linked into place afterwards instead of being rewritten.
+        passthrough = reader.format == "WAV" and reader.subtype == "FLOAT" and reader.channels == channels
+        if passthrough:
+            for block in blocks:
+                peak = max(peak, float(block.max()), -float(block.min()))
+                frames += block.shape[0]
+        else:
+            with sf.SoundFile(output_path, "w", samplerate=sr, channels=channels, subtype="FLOAT") as writer:
+                for block in blocks:
+                    peak = max(peak, float(block.max()), -float(block.min()))
+                    writer.write(block)
+                    frames += block.shape[0]
+
+    if frames == 0:
+        output_path.unlink(missing_ok=True)
+        raise PipelineError("Uploaded file appears to be empty")
+    if peak < 1e-4:
+        output_path.unlink(missing_ok=True)
+        raise PipelineError("Uploaded audio appears to be silent")
+    if passthrough:
+        _link_or_copy(source, output_path)
+    return {"duration": frames / sr, "sample_rate": sr, "source_path": source}
+
+
+def _link_or_copy(source: Path, output_path: Path) -> None:
+    output_path.unlink(missing_ok=True)
+    try:
+        os.link(source, output_path)
+    except OSError:
+        shutil.copyfile(source, output_path)
+
+
+def _normalise_array(audio_data: np.ndarray, sr: int, source: Path, output_path: Path, options: PipelineOptions) -> dict:
     if audio_data.size == 0:
         raise PipelineError("Uploaded file appears to be empty")
     if isinstance(audio_data, np.ndarray) and audio_data.ndim > 1 and options.mono:
-        audio_data = np.mean(audio_data, axis=0)
+        audio_data = _downmix(audio_data)
     target_sr = options.sample_rate
     if sr != target_sr:
-        if librosa:
-            audio_data = librosa.resample(audio_data, orig_sr=sr, target_sr=target_sr)
+        if scipy_signal is not None:
+            audio_data = _resample_poly(audio_data, sr, target_sr)
         else:
-            duration = audio_data.shape[-1] / sr
-            target_length = int(duration * target_sr)
-            if target_length <= 0:
-                raise PipelineError("Unable to resample audio: invalid duration")
-            indices = np.linspace(0, audio_data.shape[-1] - 1, num=target_length)
-            if audio_data.ndim == 1:
-                audio_data = np.interp(indices, np.arange(audio_data.shape[-1]), audio_data)
-            else:
-                audio_data = np.vstack(
-                    [np.interp(indices, np.arange(channel.shape[-1]), channel) for channel in audio_data]
-                )
+            audio_data = _resample_linear(audio_data, sr, target_sr)
         sr = target_sr
-    peak = np.max(np.abs(audio_data))
+    # max/min reductions avoid materialising np.abs(audio_data).
+    peak = max(float(audio_data.max()), -float(audio_data.min()))
     if peak < 1e-4:
         raise PipelineError("Uploaded audio appears to be silent")
-    audio_to_write = audio_data
-    if isinstance(audio_data, np.ndarray) and audio_data.ndim > 1:
-        audio_to_write = np.moveaxis(audio_data, 0, -1)
-    sf.write(output_path, audio_to_write.astype(np.float32), sr)
-    duration = audio_data.shape[-1] / sr
+    _write_float32(output_path, audio_data, sr)
+    duration = audio_data.shape[0] / sr
     return {"duration": float(duration), "sample_rate": sr, "source_path": source}
 
 
+def _write_float32(output_path: Path, audio_data: np.ndarray, sr: int) -> None:
+    # The pipeline already holds C-contiguous float32, so buffer_write hands
+    # the buffer to libsndfile without the conversion copy sf.write makes.
+    audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
+    channels = 1 if audio_data.ndim == 1 else audio_data.shape[1]
+    with sf.SoundFile(output_path, "w", samplerate=sr, channels=channels, subtype="FLOAT") as writer:
+        writer.buffer_write(audio_data, dtype="float32")
+
+
+def _downmix(audio_data: np.ndarray) -> np.ndarray:
+    # Audio stays interleaved as (frames, channels), the layout libsndfile
+    # reads and writes. Accumulate straight into a float32 result rather than
+    # materialising a full-precision sum and dividing it in a second pass.
+    if audio_data.shape[1] == 2:
+        mono = np.add(audio_data[:, 0], audio_data[:, 1], dtype=np.float32)
+        mono *= 0.5
+        return mono
+    return np.mean(audio_data, axis=1, dtype=np.float32)
+
+
+def _resample_poly(audio_data: np.ndarray, sr: int, target_sr: int) -> np.ndarray:
+    g = math.gcd(sr, target_sr)
+    up, down = target_sr // g, sr // g
+    window = _resample_filter(up, down).astype(audio_data.dtype, copy=False)
+    return scipy_signal.resample_poly(audio_data, up, down, axis=0, window=window)
+
+
+@functools.lru_cache(maxsize=8)
+def _resample_filter(up: int, down: int) -> np.ndarray:
+    # Same Kaiser-windowed low-pass resample_poly designs by default, kept so
+    # repeated jobs at the same rate pair skip the firwin call.
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    return scipy_signal.firwin(2 * half_len + 1, 1.0 / max_rate, window=("kaiser", 5.0))
+
+
+def _resample_linear(audio_data: np.ndarray, sr: int, target_sr: int) -> np.ndarray:
+    length = audio_data.shape[0]
+    target_length = int(length / sr * target_sr)
+    if target_length <= 0:
+        raise PipelineError("Unable to resample audio: invalid duration")
+    i0, i1, frac = _linear_resample_indices(length, target_length)
+    frac = frac.astype(audio_data.dtype, copy=False)
+    if audio_data.ndim > 1:
+        frac = frac[:, np.newaxis]
+    # One expression over every channel at once instead of np.interp per channel.
+    return audio_data[i0] * (1 - frac) + audio_data[i1] * frac
+
+
+def _linear_resample_indices(length: int, target_length: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # float64 positions keep the fractional weights exact for long inputs.
+    positions = np.linspace(0, length - 1, num=target_length)
+    i0 = positions.astype(np.int64)
+    i1 = np.minimum(i0 + 1, length - 1)
+    frac = positions - i0
+    return i0, i1, frac
+
+
 def _load_audio_array(source: Path) -> tuple[np.ndarray, int]:
     suffix = source.suffix.lower()
-    prefer_librosa = suffix in {".mp3", ".m4a", ".aac"}
+    prefer_av = suffix in _COMPRESSED_SUFFIXES
     last_error: Exception | None = None
 
-    if not prefer_librosa:
+    if not prefer_av:
         try:
-            audio_data, sr = sf.read(source, always_2d=False)
-            if isinstance(audio_data, np.ndarray) and audio_data.ndim == 2:
-                audio_data = audio_data.T
+            audio_data, sr = sf.read(source, always_2d=False, dtype="float32")
             return np.asarray(audio_data), int(sr)
         except Exception as exc:
             last_error = exc
-            prefer_librosa = librosa is not None
+            prefer_av = av is not None
 
-    if librosa is not None and prefer_librosa:
+    if av is not None and prefer_av:
         try:
-            audio_data, sr = librosa.load(source, sr=None, mono=False)
-            return np.asarray(audio_data), int(sr)
+            return _decode_with_av(source)
         except Exception as exc:
             last_error = exc
 
     message = "Failed to decode audio"
-    if librosa is None:
-        message += ": install librosa for extended format support"
+    if av is None:
+        message += ": install av for extended format support"
     if last_error is not None:
         raise PipelineError(message) from last_error
     raise PipelineError(message)
 
 
+def _decode_with_av(source: Path) -> tuple[np.ndarray, int]:
+    with av.open(str(source)) as container:
+        stream = container.streams.audio[0]
+        sr = stream.rate
+        # Packed float32 keeps samples interleaved, the layout the rest of
+        # the pipeline and libsndfile use.
+        resampler = av.AudioResampler(format="flt", layout=stream.layout, rate=sr)
+        chunks: list[np.ndarray] = []
+        for frame in container.decode(stream):
+            for out in resampler.resample(frame):
+                chunks.append(out.to_ndarray().reshape(out.samples, -1))
+        for out in resampler.resample(None):
+            chunks.append(out.to_ndarray().reshape(out.samples, -1))
+    if not chunks:
+        raise PipelineError("Uploaded file appears to be empty")
+    audio_data = np.concatenate(chunks)
+    if audio_data.shape[1] == 1:
+        audio_data = audio_data[:, 0]
+    return audio_data, int(sr)
+
+
 class BaseTranscriber:
     async def transcribe(self, audio_path: Path, midi_output: Path, job: Job, audio_info: dict) -> None:  # pragma: no cover - interface
         raise NotImplementedError
@@ -170,9 +380,10 @@ class BasicPitchTranscriber(BaseTranscriber):
         except Exception as exc:  # pragma: no cover - optional import
             raise PipelineError(f"Basic Pitch unavailable: {exc}") from exc
 
-        await asyncio.get_event_loop().run_in_executor(
-            None,
-            lambda: predict(
+        await _run_stage(
+            "transcribe",
+            functools.partial(
+                predict,
                 audio_path,
                 output_directory=midi_output.parent,
                 save_midi=True,
@@ -202,7 +413,7 @@ class StubTranscriber(BaseTranscriber):
     async def transcribe(self, audio_path: Path, midi_output: Path, job: Job, audio_info: dict) -> None:
         sf.info(str(audio_path))
         midi_output.parent.mkdir(parents=True, exist_ok=True)
-        midi_output.write_bytes(self._template.read_bytes())
+        shutil.copyfile(self._template, midi_output)
 
 
 def load_transcriber() -> BaseTranscriber:
@@ -214,12 +425,15 @@ def load_transcriber() -> BaseTranscriber:
 
 
 def _default_stub_midi() -> Path:
-    stub_dir = settings.storage_dir / "stubs"
+    return _stub_midi_in(settings.storage_dir)
+
+
+@functools.lru_cache(maxsize=4)
+def _stub_midi_in(storage_dir: Path) -> Path:
+    stub_dir = storage_dir / "stubs"
     stub_dir.mkdir(exist_ok=True)
     stub = stub_dir / "basic.mid"
     if not stub.exists():
-        import pretty_midi
-
         midi = pretty_midi.PrettyMIDI()
         instrument = pretty_midi.Instrument(program=0)
         for i, pitch in enumerate([60, 62, 64, 65, 67, 69, 71, 72]):
@@ -246,8 +460,8 @@ class MidiQuantizer:
     }
 
     def quantize(self, midi_input: Path, midi_output: Path, job: Job) -> None:
-        import pretty_midi
-
+        if pretty_midi is None:
+            raise PipelineError("pretty_midi is required for quantisation")
         pm = pretty_midi.PrettyMIDI(str(midi_input))
         grid = job.options.quantization
         step_map = {
@@ -260,17 +474,27 @@ class MidiQuantizer:
         if job.options.loose_quantization:
             beat_length *= 0.5
         for instrument in pm.instruments:
-            for note in instrument.notes:
-                note.start = round(note.start / beat_length) * beat_length
-                note.end = max(note.start + beat_length, round(note.end / beat_length) * beat_length)
+            self._snap_notes(instrument.notes, beat_length)
             self._enforce_polyphony(instrument, job.options.instrument)
             self._set_instrument_program(instrument, job.options.instrument)
         pm.remove_invalid_notes()
         pm.write(str(midi_output))
 
-    def _set_instrument_program(self, instrument, choice: InstrumentChoice) -> None:
-        import pretty_midi
+    @staticmethod
+    def _snap_notes(notes: list[Any], beat_length: float) -> None:
+        if not notes:
+            return
+        count = len(notes)
+        starts = np.fromiter((note.start for note in notes), dtype=np.float64, count=count)
+        ends = np.fromiter((note.end for note in notes), dtype=np.float64, count=count)
+        # np.round rounds half to even, matching the built-in round().
+        q_starts = np.round(starts / beat_length) * beat_length
+        q_ends = np.maximum(q_starts + beat_length, np.round(ends / beat_length) * beat_length)
+        for note, start, end in zip(notes, q_starts.tolist(), q_ends.tolist()):
+            note.start = start
+            note.end = end
 
+    def _set_instrument_program(self, instrument, choice: InstrumentChoice) -> None:
         program_name = self._PROGRAM_MAP.get(choice, self._PROGRAM_MAP[InstrumentChoice.piano])
         try:
             program = pretty_midi.instrument_name_to_program(program_name)
@@ -306,14 +530,12 @@ class MetadataBuilder:
         self.meta: JobMeta | None = None
 
     def build_musicxml(self, midi_path: Path, output_path: Path, job: Job) -> Path:
-        from music21 import clef, converter, key, meter, metadata, tempo
-        import pretty_midi
-
-        pm = pretty_midi.PrettyMIDI(str(midi_path))
-        score = converter.parse(str(midi_path))
+        if music21 is None:
+            raise PipelineError("music21 is required to build MusicXML")
+        score = music21.converter.parse(str(midi_path))
         first_staff = score.parts[0] if score.parts else score
         first_staff.insert(0, self._clef_for(job.options.clef))
-        score.metadata = metadata.Metadata()
+        score.metadata = music21.metadata.Metadata()
         score.metadata.title = "ScoreForge Transcription"
         instrument_name = self._instrument_label(job.options.instrument)
         score.metadata.instrumentation = instrument_name
@@ -321,36 +543,31 @@ class MetadataBuilder:
 
         metronome_mark = None
         if job.options.tempo:
-            metronome_mark = tempo.MetronomeMark(number=job.options.tempo)
+            metronome_mark = music21.tempo.MetronomeMark(number=job.options.tempo)
             score.insert(0, metronome_mark)
         else:
-            marks = list(score.recurse().getElementsByClass(tempo.MetronomeMark))
+            marks = list(score.recurse().getElementsByClass(music21.tempo.MetronomeMark))
             if marks:
                 metronome_mark = marks[0]
 
-        detected_key = score.analyze("key")
-        applied_key = detected_key
+        applied_key = None
         if job.options.force_key:
             try:
-                applied_key = key.Key(job.options.force_key)
+                applied_key = music21.key.Key(job.options.force_key)
                 score.insert(0, applied_key)
             except Exception:
-                applied_key = detected_key
+                applied_key = None
+        if applied_key is None:
+            # Key analysis is the costliest step here; only run it when no
+            # valid key was forced.
+            applied_key = score.analyze("key")
 
-        note_count = sum(len(instrument.notes) for instrument in pm.instruments)
+        note_count = self._count_notes(score)
         tempo_value = job.options.tempo or (metronome_mark.number if metronome_mark else 120)
         tempo_value = tempo_value or 120
         duration_seconds = float(score.duration.quarterLength) * (60.0 / tempo_value)
 
-        self.meta = JobMeta(
-            title=score.metadata.title,
-            key=str(applied_key) if applied_key else None,
-            tempo=int(tempo_value) if tempo_value else None,
-            note_count=note_count,
-            duration_seconds=duration_seconds,
-            instrument=job.options.instrument,
-        )
-
+        time_signature = None
         if job.options.detect_time_signature:
             ts = None
             try:
@@ -358,18 +575,37 @@ class MetadataBuilder:
             except Exception:
                 pass
             if not ts:
-                existing_ts = list(score.recurse().getElementsByClass(meter.TimeSignature))
+                existing_ts = list(score.recurse().getElementsByClass(music21.meter.TimeSignature))
                 if existing_ts:
                     ts = existing_ts[0]
-            if self.meta:
-                self.meta.time_signature = str(ts) if ts else None
+            time_signature = str(ts) if ts else None
+
+        self.meta = JobMeta(
+            title=score.metadata.title,
+            key=str(applied_key) if applied_key else None,
+            time_signature=time_signature,
+            tempo=int(tempo_value) if tempo_value else None,
+            note_count=note_count,
+            duration_seconds=duration_seconds,
+            instrument=job.options.instrument,
+        )
 
         score.write("musicxml", fp=str(output_path))
         return output_path
 
-    def _clef_for(self, clef_choice: ClefChoice):
-        from music21 import clef
+    @staticmethod
+    def _count_notes(score) -> int:
+        # music21 splits notes across barlines into tied pieces; count onsets only.
+        count = 0
+        for element in score.recurse().notes:
+            for note in getattr(element, "notes", (element,)):
+                tie = note.tie or element.tie
+                if tie is None or tie.type == "start":
+                    count += 1
+        return count
 
+    def _clef_for(self, clef_choice: ClefChoice):
+        clef = music21.clef
         mapping = {
             ClefChoice.treble: clef.TrebleClef(),
             ClefChoice.alto: clef.AltoClef(),
@@ -388,8 +624,7 @@ class MetadataBuilder:
         return labels.get(instrument_choice, instrument_choice.value.title())
 
     def _apply_instrumentation(self, score, instrument_choice: InstrumentChoice) -> None:
-        from music21 import instrument as m21_instrument
-
+        m21_instrument = music21.instrument
         instrument_class = {
             InstrumentChoice.piano: m21_instrument.Piano,
             InstrumentChoice.violin: m21_instrument.Violin,
@@ -407,32 +642,49 @@ class MetadataBuilder:
 
 
 class BaseEngraver:
-    def engrave(self, musicxml_path: Path, pdf_path: Path) -> None:  # pragma: no cover - interface
+    async def engrave(self, musicxml_path: Path, pdf_path: Path) -> None:  # pragma: no cover - interface
         raise NotImplementedError
 
 
+async def _run_command(command: list[str]) -> None:
+    try:
+        process = await asyncio.create_subprocess_exec(*command)
+    except NotImplementedError:  # pragma: no cover - selector event loop on Windows
+        await _run_stage("engrave", functools.partial(subprocess.run, command, check=True))
+        return
+    returncode = await process.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, command)
+
+
 class LilypondEngraver(BaseEngraver):
     def __init__(self, executable: str | None = None) -> None:
         self.executable = executable or settings.engraver_path or "lilypond"
+        self._musicxml2ly_cache: str | None = None
 
-    def engrave(self, musicxml_path: Path, pdf_path: Path) -> None:
+    async def engrave(self, musicxml_path: Path, pdf_path: Path) -> None:
         ly_path = musicxml_path.with_suffix(".ly")
         musicxml2ly_executable = self._musicxml2ly_executable()
-        subprocess.run([
+        await _run_command([
             musicxml2ly_executable,
             str(musicxml_path),
             "-o",
             str(ly_path),
-        ], check=True)
+        ])
         pdf_path.parent.mkdir(parents=True, exist_ok=True)
-        subprocess.run([
+        await _run_command([
             self.executable,
             "-o",
             str(pdf_path.with_suffix("")),
             str(ly_path),
-        ], check=True)
+        ])
 
     def _musicxml2ly_executable(self) -> str:
+        if self._musicxml2ly_cache is None:
+            self._musicxml2ly_cache = self._resolve_musicxml2ly()
+        return self._musicxml2ly_cache
+
+    def _resolve_musicxml2ly(self) -> str:
         if settings.musicxml2ly_path:
             return settings.musicxml2ly_path
 
@@ -475,18 +727,21 @@ class MuseScoreEngraver(BaseEngraver):
     def __init__(self, executable: str | None = None) -> None:
         self.executable = executable or settings.engraver_path or "mscore"
 
-    def engrave(self, musicxml_path: Path, pdf_path: Path) -> None:
+    async def engrave(self, musicxml_path: Path, pdf_path: Path) -> None:
         pdf_path.parent.mkdir(parents=True, exist_ok=True)
-        subprocess.run([
+        await _run_command([
             self.executable,
             "-o",
             str(pdf_path),
             str(musicxml_path),
-        ], check=True)
+        ])
 
 
 class PlaceholderEngraver(BaseEngraver):
-    def engrave(self, musicxml_path: Path, pdf_path: Path) -> None:
+    async def engrave(self, musicxml_path: Path, pdf_path: Path) -> None:
+        await _run_stage("engrave", self._render, musicxml_path, pdf_path)
+
+    def _render(self, musicxml_path: Path, pdf_path: Path) -> None:
         try:
             from reportlab.lib.pagesizes import letter
             from reportlab.pdfgen import canvas
@@ -504,9 +759,15 @@ class PlaceholderEngraver(BaseEngraver):
 
 
 def load_engraver() -> BaseEngraver:
-    engraver = settings.engraver.lower()
+    return _engraver_for(settings.engraver.lower(), settings.engraver_path)
+
+
+@functools.lru_cache(maxsize=4)
+def _engraver_for(engraver: str, engraver_path: str | None) -> BaseEngraver:
+    # Engravers are stateless apart from their resolved executables, so one
+    # instance per configuration is reused across jobs.
     if engraver == "lilypond":
-        return LilypondEngraver()
+        return LilypondEngraver(engraver_path)
     if engraver == "musescore":
-        return MuseScoreEngraver()
+        return MuseScoreEngraver(engraver_path)
     return PlaceholderEngraver()
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
 import asyncio
+import io
+import threading
 from datetime import timedelta
 
+import fakeredis
+import numpy as np
 import pytest
+import soundfile as sf
 from fastapi import FastAPI
 from httpx import AsyncClient
 
 from ..config import settings
-from ..models import JobOptions, JobStatus
+from ..models import ClefChoice, Job, JobOptions, JobStatus
 from ..routes import jobs
 from ..services.job_manager import JobManager
-from ..services.job_store import JobStore
+from ..services.job_store import JobStore, RedisJobStore
 
 
 @pytest.mark.asyncio
@@ -49,3 +54,305 @@ async def test_job_lookup_from_shared_store(tmp_path, monkeypatch) -> None:
     finally:
         await manager_a.shutdown()
         await manager_b.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_reload_skips_jobs_allocated_during_startup(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "storage_dir", tmp_path, raising=False)
+
+    runs: list[str] = []
+
+    async def _processor(job) -> None:
+        runs.append(job.id)
+
+    store = JobStore(settings.storage_dir)
+    listing = threading.Event()
+    release = threading.Event()
+    list_jobs = store.list_jobs
+
+    def _slow_list_jobs():
+        listing.set()
+        release.wait(timeout=2)
+        return list_jobs()
+
+    monkeypatch.setattr(store, "list_jobs", _slow_list_jobs)
+    manager = JobManager(processor=_processor, retention=timedelta(minutes=5), store=store)
+
+    try:
+        before = await manager.allocate(JobOptions())
+        reload_task = asyncio.create_task(manager.load_existing_jobs())
+        await asyncio.to_thread(listing.wait, 2)
+        during = await manager.allocate(JobOptions())
+        release.set()
+        await reload_task
+
+        await asyncio.sleep(0.05)
+        assert runs == []
+
+        await manager.enqueue(before)
+        await manager.enqueue(during)
+        await asyncio.wait_for(manager._queue.join(), timeout=2)
+
+        assert sorted(runs) == sorted([before.id, during.id])
+        assert sorted(job_id for _, job_id in manager._expiry_heap) == sorted([before.id, during.id])
+        assert manager._local_ids is None
+
+        await manager.allocate(JobOptions())
+        assert manager._local_ids is None
+    finally:
+        await manager.shutdown()
+
+
+def test_redis_store_round_trip(tmp_path) -> None:
+    client = fakeredis.FakeRedis()
+    store = RedisJobStore(client)
+
+    job = Job.create(options=JobOptions(), retention=timedelta(minutes=5), workdir=tmp_path)
+    store.save(job)
+
+    fetched = store.get(job.id)
+    assert fetched is not None
+    assert abs(fetched.expires_at - job.expires_at) < timedelta(milliseconds=1)
+    assert 0 < client.ttl(f"jobs:{job.id}") <= 5 * 60
+    assert [listed.id for listed in store.list_jobs()] == [job.id]
+
+    store.delete(job.id)
+    assert store.get(job.id) is None
+    assert list(store.list_jobs()) == []
+
+
+def test_redis_store_drops_index_entries_for_expired_hashes(tmp_path) -> None:
+    client = fakeredis.FakeRedis()
+    store = RedisJobStore(client)
+
+    kept = Job.create(options=JobOptions(), retention=timedelta(minutes=5), workdir=tmp_path)
+    evicted = Job.create(options=JobOptions(), retention=timedelta(minutes=5), workdir=tmp_path)
+    store.save(kept)
+    store.save(evicted)
+    # Stand in for Redis evicting the hash once its expiry passes.
+    client.delete(f"jobs:{evicted.id}")
+
+    assert [listed.id for listed in store.list_jobs()] == [kept.id]
+    assert client.smembers("jobs:index") == {kept.id.encode()}
+
+
+@pytest.mark.asyncio
+async def test_expired_jobs_removed_without_polling(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "storage_dir", tmp_path, raising=False)
+
+    async def _processor(job) -> None:
+        await asyncio.sleep(0)
+
+    store = JobStore(settings.storage_dir)
+    manager = JobManager(processor=_processor, retention=timedelta(milliseconds=100), store=store)
+
+    try:
+        job = await manager.submit(JobOptions())
+        await asyncio.wait_for(manager._queue.join(), timeout=2)
+        await asyncio.sleep(0.3)
+
+        assert store.get(job.id) is None
+        assert not job.workdir.exists()
+    finally:
+        await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_job_expiring_mid_run_is_not_saved_back(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "storage_dir", tmp_path, raising=False)
+
+    async def _processor(job) -> None:
+        await asyncio.sleep(0.3)
+
+    store = JobStore(settings.storage_dir)
+    manager = JobManager(processor=_processor, retention=timedelta(milliseconds=100), store=store)
+
+    try:
+        job = await manager.submit(JobOptions())
+        await asyncio.wait_for(manager._queue.join(), timeout=2)
+
+        assert store.get(job.id) is None
+        assert job.id not in manager._cache
+        assert not job.workdir.exists()
+    finally:
+        await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_create_job_streams_upload_to_workdir(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "storage_dir", tmp_path, raising=False)
+
+    async def _processor(job) -> None:
+        await asyncio.sleep(0)
+
+    manager = JobManager(processor=_processor, retention=timedelta(minutes=5), store=JobStore(tmp_path))
+    app = FastAPI()
+    app.state.job_manager = manager
+    app.include_router(jobs.router, prefix="/api")
+
+    buffer = io.BytesIO()
+    t = np.linspace(0, 1.0, 44100, endpoint=False)
+    sf.write(buffer, 0.2 * np.sin(2 * np.pi * 440 * t), 44100, format="WAV")
+
+    try:
+        async with AsyncClient(app=app, base_url="http://testserver") as client:
+            response = await client.post(
+                "/api/jobs",
+                files={"file": ("clip.wav", buffer.getvalue(), "audio/wav")},
+                data={"clef": "bass", "loose_quantization": "yes"},
+            )
+
+        assert response.status_code == 200
+        job = await manager.get(response.json()["job_id"])
+        assert job is not None
+        assert job.options.clef == ClefChoice.bass
+        assert job.options.loose_quantization is True
+        assert (job.workdir / "upload.wav").read_bytes() == buffer.getvalue()
+    finally:
+        await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_status_reads_served_from_cache(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "storage_dir", tmp_path, raising=False)
+
+    async def _processor(job) -> None:
+        await asyncio.sleep(0)
+
+    store = JobStore(settings.storage_dir)
+    manager = JobManager(processor=_processor, retention=timedelta(minutes=5), store=store)
+
+    try:
+        job = await manager.submit(JobOptions())
+        await asyncio.wait_for(manager._queue.join(), timeout=2)
+
+        def _fail(job_id):
+            raise AssertionError("store should not be read for cached jobs")
+
+        monkeypatch.setattr(store, "get", _fail)
+        fetched = await manager.get(job.id)
+        assert fetched is not None
+        assert fetched.status == JobStatus.done
+    finally:
+        await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_bounds_concurrency(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "storage_dir", tmp_path, raising=False)
+
+    running = 0
+    peak = 0
+
+    async def _processor(job) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+
+    manager = JobManager(
+        processor=_processor,
+        retention=timedelta(minutes=5),
+        store=JobStore(settings.storage_dir),
+        max_concurrency=2,
+    )
+
+    try:
+        for _ in range(5):
+            await manager.submit(JobOptions())
+        await asyncio.wait_for(manager._queue.join(), timeout=2)
+        assert peak == 2
+    finally:
+        await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_worker_survives_failed_save(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "storage_dir", tmp_path, raising=False)
+
+    ran: list[str] = []
+
+    async def _processor(job) -> None:
+        ran.append(job.id)
+
+    store = JobStore(settings.storage_dir)
+    save = store.save
+    failed: list[str] = []
+
+    def _flaky_save(job) -> None:
+        if job.status == JobStatus.done and not failed:
+            failed.append(job.id)
+            raise OSError("disk full")
+        save(job)
+
+    monkeypatch.setattr(store, "save", _flaky_save)
+    manager = JobManager(processor=_processor, retention=timedelta(minutes=5), store=store, max_concurrency=1)
+
+    try:
+        first = await manager.submit(JobOptions())
+        second = await manager.submit(JobOptions())
+        await asyncio.wait_for(manager._queue.join(), timeout=2)
+
+        assert failed == [first.id]
+        assert ran == [first.id, second.id]
+        assert all(not task.done() for task in manager._worker_tasks)
+    finally:
+        await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_create_job_rejects_oversized_content_length(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "storage_dir", tmp_path, raising=False)
+    monkeypatch.setattr(settings, "max_file_mb", 1, raising=False)
+
+    async def _processor(job) -> None:
+        await asyncio.sleep(0)
+
+    store = JobStore(tmp_path)
+    manager = JobManager(processor=_processor, retention=timedelta(minutes=5), store=store)
+    app = FastAPI()
+    app.state.job_manager = manager
+    app.include_router(jobs.router, prefix="/api")
+
+    try:
+        async with AsyncClient(app=app, base_url="http://testserver") as client:
+            response = await client.post(
+                "/api/jobs",
+                files={"file": ("clip.wav", b"\0" * (2 * 1024 * 1024), "audio/wav")},
+            )
+
+        assert response.status_code == 413
+        assert list(store.list_jobs()) == []
+    finally:
+        await manager.shutdown()
+
+
+def test_job_store_only_reparses_changed_files(tmp_path, monkeypatch) -> None:
+    from ..services import job_store
+
+    writer = JobStore(tmp_path)
+    reader = JobStore(tmp_path)
+    job = Job.create(options=JobOptions(), retention=timedelta(minutes=5), workdir=tmp_path)
+    writer.save(job)
+
+    assert [listed.id for listed in reader.list_jobs()] == [job.id]
+
+    decode = job_store._decode_job
+    calls: list[bytes] = []
+
+    def _counting_decode(raw: bytes):
+        calls.append(raw)
+        return decode(raw)
+
+    monkeypatch.setattr(job_store, "_decode_job", _counting_decode)
+    assert [listed.id for listed in reader.list_jobs()] == [job.id]
+    assert calls == []
+
+    job.status = JobStatus.done
+    writer.save(job)
+    assert [listed.status for listed in reader.list_jobs()] == [JobStatus.done]
+    assert len(calls) == 1
+
+    writer.delete(job.id)
+    assert list(reader.list_jobs()) == []
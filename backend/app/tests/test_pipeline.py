@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 from pathlib import Path, PureWindowsPath
 from typing import Iterable
@@ -8,9 +9,9 @@ import shutil
 import numpy as np
 import pytest
 import soundfile as sf
-import subprocess
 
 from ..models import ClefChoice, InstrumentChoice, JobOptions, QuantizationGrid, Job
+from ..services import pipeline
 from ..services.pipeline import (
     PipelineDependencies,
     PlaceholderEngraver,
@@ -19,6 +20,8 @@ from ..services.pipeline import (
     BaseTranscriber,
     LilypondEngraver,
     MetadataBuilder,
+    PipelineError,
+    _normalise_audio,
 )
 from ..config import settings
 
@@ -44,7 +47,23 @@ class MidiFixtureTranscriber(BaseTranscriber):
         midi.write(str(midi_output))
 
 
-@pytest.fixture
+class TimedMidiTranscriber(BaseTranscriber):
+    def __init__(self, notes: Iterable[tuple[float, float, int]]) -> None:
+        self.notes = list(notes)
+
+    async def transcribe(self, audio_path: Path, midi_output: Path, job, audio_info) -> None:
+        import pretty_midi
+
+        midi_output.parent.mkdir(parents=True, exist_ok=True)
+        midi = pretty_midi.PrettyMIDI()
+        instrument = pretty_midi.Instrument(program=0)
+        for start, end, pitch in self.notes:
+            instrument.notes.append(pretty_midi.Note(start=start, end=end, pitch=pitch, velocity=90))
+        midi.instruments.append(instrument)
+        midi.write(str(midi_output))
+
+
+@pytest.fixture(scope="session")
 def sine_wave_data() -> tuple[np.ndarray, int]:
     sample_rate = 44100
     duration = 1.0
@@ -53,16 +72,18 @@ def sine_wave_data() -> tuple[np.ndarray, int]:
     return waveform.astype(np.float32), sample_rate
 
 
-@pytest.fixture
-def sine_wave(tmp_path: Path, sine_wave_data: tuple[np.ndarray, int]) -> Path:
+# The audio fixtures are written once per session; tests copy them into
+# their own workdir, so nothing downstream mutates the shared files.
+@pytest.fixture(scope="session")
+def sine_wave(tmp_path_factory: pytest.TempPathFactory, sine_wave_data: tuple[np.ndarray, int]) -> Path:
     waveform, sample_rate = sine_wave_data
-    path = tmp_path / "upload.wav"
+    path = tmp_path_factory.mktemp("audio") / "upload.wav"
     sf.write(path, waveform, sample_rate)
     return path
 
 
-@pytest.fixture
-def sine_wave_mp3(tmp_path: Path, sine_wave_data: tuple[np.ndarray, int]) -> Path:
+@pytest.fixture(scope="session")
+def sine_wave_mp3(tmp_path_factory: pytest.TempPathFactory, sine_wave_data: tuple[np.ndarray, int]) -> Path:
     waveform, sample_rate = sine_wave_data
     import lameenc
 
@@ -74,7 +95,7 @@ def sine_wave_mp3(tmp_path: Path, sine_wave_data: tuple[np.ndarray, int]) -> Pat
     pcm = np.clip(waveform, -1.0, 1.0)
     pcm16 = (pcm * 32767).astype(np.int16)
     mp3_data = encoder.encode(pcm16.tobytes()) + encoder.flush()
-    path = tmp_path / "upload.mp3"
+    path = tmp_path_factory.mktemp("audio") / "upload.mp3"
     path.write_bytes(mp3_data)
     return path
 
@@ -136,6 +157,78 @@ async def test_pipeline_generates_artifacts(
     assert job.meta.instrument == instrument_choice
 
 
+@pytest.mark.parametrize("loose_quantization", [False, True])
+@pytest.mark.asyncio
+async def test_pipeline_exports_complex_durations(tmp_path: Path, sine_wave: Path, loose_quantization: bool) -> None:
+    job = _build_job(
+        tmp_path,
+        JobOptions(quantization=QuantizationGrid.sixteenth, loose_quantization=loose_quantization),
+    )
+    shutil.copy(sine_wave, job.workdir / sine_wave.name)
+    # Five- and seven-sixteenth notes plus rests of odd lengths, with one note
+    # crossing the barline, only export once music21 splits them up.
+    notes = [(0.125, 0.75, 60), (0.875, 1.75, 62), (1.9, 2.3, 64), (2.4, 3.2, 65)]
+    deps = PipelineDependencies(engraver=PlaceholderEngraver(), transcriber=TimedMidiTranscriber(notes))
+
+    await run_pipeline(job, deps, PipelineOptions())
+
+    assert job.artifacts["musicxml"].exists()
+    assert job.meta is not None
+    assert job.meta.note_count == len(notes)
+
+
+@pytest.mark.parametrize("use_scipy", [True, False])
+@pytest.mark.asyncio
+async def test_normalise_audio_downmixes_and_resamples(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_scipy: bool
+) -> None:
+    if not use_scipy:
+        monkeypatch.setattr(pipeline, "scipy_signal", None)
+    job = _build_job(tmp_path, JobOptions())
+    sample_rate = 48000
+    t = np.linspace(0, 1.0, sample_rate, endpoint=False)
+    left = 0.2 * np.sin(2 * np.pi * 440 * t)
+    stereo = np.stack([left, 0.5 * left], axis=1).astype(np.float32)
+    sf.write(job.workdir / "upload.wav", stereo, sample_rate)
+
+    output_path = job.workdir / "input.wav"
+    audio_info = await _normalise_audio(job, output_path, PipelineOptions())
+
+    written, written_sr = sf.read(output_path, dtype="float32")
+    assert written_sr == 44100
+    assert written.ndim == 1
+    assert abs(written.shape[0] - 44100) <= 1
+    assert audio_info["sample_rate"] == 44100
+    assert audio_info["duration"] == pytest.approx(1.0, abs=1e-3)
+    assert np.max(np.abs(written)) == pytest.approx(0.15, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_normalise_audio_links_already_normalised_upload(tmp_path: Path, sine_wave_data) -> None:
+    waveform, sample_rate = sine_wave_data
+    job = _build_job(tmp_path, JobOptions())
+    upload = job.workdir / "upload.wav"
+    sf.write(upload, waveform, sample_rate, subtype="FLOAT")
+
+    output_path = job.workdir / "input.wav"
+    audio_info = await _normalise_audio(job, output_path, PipelineOptions())
+
+    assert output_path.samefile(upload)
+    assert audio_info["sample_rate"] == sample_rate
+    assert audio_info["duration"] == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_normalise_audio_rejects_silence(tmp_path: Path) -> None:
+    job = _build_job(tmp_path, JobOptions())
+    sf.write(job.workdir / "upload.wav", np.zeros((44100, 2), dtype=np.float32), 44100)
+
+    output_path = job.workdir / "input.wav"
+    with pytest.raises(PipelineError, match="silent"):
+        await _normalise_audio(job, output_path, PipelineOptions())
+    assert not output_path.exists()
+
+
 def test_metadata_builder_supports_bass_clef():
     builder = MetadataBuilder()
     bass_clef = builder._clef_for(ClefChoice.bass)
@@ -145,7 +238,27 @@ def test_metadata_builder_supports_bass_clef():
     assert isinstance(bass_clef, music21_clef.BassClef)
 
 
-def test_lilypond_engraver_resolves_musicxml2ly(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+def test_metadata_builder_skips_key_analysis_when_key_forced(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import music21
+
+    job = _build_job(tmp_path, JobOptions(force_key="D", detect_time_signature=False))
+    midi_path = tmp_path / "quantized.mid"
+    asyncio.run(MidiFixtureTranscriber([[62], [66], [69]]).transcribe(tmp_path / "input.wav", midi_path, job, {}))
+
+    def fail_analyze(self, *args, **kwargs):
+        raise AssertionError("analyze should not run")
+
+    monkeypatch.setattr(music21.stream.Stream, "analyze", fail_analyze)
+    builder = MetadataBuilder()
+    builder.build_musicxml(midi_path, tmp_path / "score.musicxml", job)
+
+    assert builder.meta is not None
+    assert builder.meta.key == "D major"
+    assert builder.meta.time_signature is None
+
+
+@pytest.mark.asyncio
+async def test_lilypond_engraver_resolves_musicxml2ly(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     lilypond_dir = tmp_path / "lilypond-bin"
     lilypond_dir.mkdir()
     lilypond_path = lilypond_dir / "lilypond"
@@ -157,18 +270,22 @@ def test_lilypond_engraver_resolves_musicxml2ly(monkeypatch: pytest.MonkeyPatch,
 
     calls: list[list[str]] = []
 
-    def fake_run(cmd, *args, **kwargs):
-        calls.append(cmd)
-        return subprocess.CompletedProcess(cmd, 0)
+    class FakeProcess:
+        async def wait(self) -> int:
+            return 0
+
+    async def fake_exec(*cmd, **kwargs):
+        calls.append(list(cmd))
+        return FakeProcess()
 
-    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
 
     engraver = LilypondEngraver()
     musicxml_path = tmp_path / "score.musicxml"
     pdf_path = tmp_path / "output" / "score.pdf"
     musicxml_path.write_text("<score/>")
 
-    engraver.engrave(musicxml_path, pdf_path)
+    await engraver.engrave(musicxml_path, pdf_path)
 
     assert len(calls) == 2
     assert Path(calls[0][0]) == lilypond_path.with_name("musicxml2ly")